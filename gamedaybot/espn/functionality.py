@@ -1,4 +1,129 @@
-from datetime import date
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, datetime, timedelta
+from functools import lru_cache
+import heapq
+from operator import itemgetter
+import threading
+import time
+
+# Lineup slots that do not count towards a team's starters
+_BENCH_SLOTS = frozenset(('BE', 'IR'))
+
+# Player points against their projection, as shown in the trophies
+_POINTS_FMT = '%.2f points (%.2f proj)'
+
+# Line format shared by the scoreboards: home abbrev, home score, away score, away abbrev
+_SCORE_FMT = '%4s %6.2f - %6.2f %s'
+
+# How long (in seconds) fetched box scores are reused before ESPN is queried again
+BOX_SCORE_CACHE_TTL = 60
+_box_score_cache = {}
+_box_score_cache_lock = threading.Lock()
+_starter_counts_cache = {}
+
+
+def _box_score_entry(league, week=None):
+    """
+    Retrieve the cache entry for a given week, fetching the box scores from ESPN if there is no recent entry.
+
+    Parameters
+    ----------
+    league: espn_api.football.League
+        The league for which to retrieve the box scores.
+    week: int, optional
+        The week of the season for which to retrieve the box scores, by default None (current week).
+
+    Returns
+    -------
+    tuple
+        The time of the fetch, the box scores, the head to head matchups and the starter performance table.
+    """
+
+    now = time.monotonic()
+    key = (league.league_id, league.year, week)
+    cached = _box_score_cache.get(key)
+    if not cached or now - cached[0] >= BOX_SCORE_CACHE_TTL:
+        box_scores = league.box_scores(week=week)
+        matchups = [i for i in box_scores if i.home_team and i.away_team]
+        cached = (now, box_scores, matchups, _starter_table(box_scores))
+
+        # the cache may be filled from several threads, see season_trophies
+        with _box_score_cache_lock:
+            # drop stale entries so the cache does not grow for the lifetime of the bot
+            for k in [k for k, v in _box_score_cache.items() if now - v[0] >= BOX_SCORE_CACHE_TTL]:
+                del _box_score_cache[k]
+            _box_score_cache[key] = cached
+
+    return cached
+
+
+def _cached_box_scores(league, week=None, head_to_head=False):
+    """
+    Retrieve the box scores for a given week, reusing a recent result for the same league and week if one exists.
+
+    Parameters
+    ----------
+    league: espn_api.football.League
+        The league for which to retrieve the box scores.
+    week: int, optional
+        The week of the season for which to retrieve the box scores, by default None (current week).
+    head_to_head: bool, optional
+        If True, only return the matchups that have both a home and an away team (no byes), by default False.
+
+    Returns
+    -------
+    list
+        A list of box score objects for the given week.
+    """
+
+    cached = _box_score_entry(league, week)
+    return cached[2] if head_to_head else cached[1]
+
+
+def _cached_starters(league, week=None):
+    """
+    Retrieve the starter performance table for a given week, built once alongside the cached box scores.
+
+    Parameters
+    ----------
+    league: espn_api.football.League
+        The league for which to retrieve the starters.
+    week: int, optional
+        The week of the season for which to retrieve the starters, by default None (current week).
+
+    Returns
+    -------
+    list
+        A list of (performance, player, team) tuples, see _starter_table.
+    """
+
+    return _box_score_entry(league, week)[3]
+
+
+def _starter_table(box_scores):
+    """
+    Build the table of every starter with a projection for a given week, shared by the player trophies.
+
+    Parameters
+    ----------
+    box_scores : list
+        A list of box score objects for the week
+
+    Returns
+    -------
+    list
+        A list of (performance, player, team) tuples, with the performance as returned by _performance.
+    """
+
+    starters = []
+    for i in box_scores:
+        for lineup, team in ((i.home_lineup, i.home_team), (i.away_lineup, i.away_team)):
+            for p in lineup:
+                projected = p.projected_points
+                if projected > 0 and p.slot_position not in _BENCH_SLOTS:
+                    starters.append((_performance(p.points, projected), p, team))
+    return starters
 
 
 def get_scoreboard_short(league, week=None):
@@ -20,10 +145,9 @@ def get_scoreboard_short(league, week=None):
     """
 
     # Gets current week's scoreboard
-    box_scores = league.box_scores(week=week)
-    score = ['%4s %6.2f - %6.2f %s' % (i.home_team.team_abbrev, i.home_score,
-                                       i.away_score, i.away_team.team_abbrev) for i in box_scores
-             if i.away_team]
+    box_scores = _cached_box_scores(league, week, head_to_head=True)
+    score = [_SCORE_FMT % (i.home_team.team_abbrev, i.home_score, i.away_score, i.away_team.team_abbrev)
+             for i in box_scores]
     if (week == league.current_week - 1 or week == 16):
         text = ['📋 Final Score Update 📋']
     else:
@@ -51,10 +175,10 @@ def get_projected_scoreboard(league, week=None):
     """
 
     # Gets current week's scoreboard projections
-    box_scores = league.box_scores(week=week)
-    score = ['%4s %6.2f - %6.2f %s' % (i.home_team.team_abbrev, get_projected_total(i.home_lineup),
-                                       get_projected_total(i.away_lineup), i.away_team.team_abbrev) for i in box_scores
-             if i.away_team]
+    box_scores = _cached_box_scores(league, week, head_to_head=True)
+    score = [_SCORE_FMT % (i.home_team.team_abbrev, get_projected_total(i.home_lineup),
+                           get_projected_total(i.away_lineup), i.away_team.team_abbrev)
+             for i in box_scores]
     text = ['Approximate Projected Scores'] + score
     return '\n'.join(text)
 
@@ -80,7 +204,8 @@ def get_standings(league, top_half_scoring=False, week=None):
 
     standings_txt = ''
     teams = league.teams
-    standings = []
+    if not week:
+        week = league.current_week
     if not top_half_scoring:
         standings = league.standings()
         if (week <= 13):
@@ -92,19 +217,15 @@ def get_standings(league, top_half_scoring=False, week=None):
     else:
         # top half scoring can be enabled by default in ESPN now.
         # this should generally not be used
-        top_half_totals = {t.team_name: 0 for t in teams}
-        if not week:
-            week = league.current_week
+        # one sweep over the completed weeks, each week's box scores are fetched once through the cache
+        top_half_totals = {t: 0 for t in teams}
         for w in range(1, week):
-            top_half_totals = top_half_wins(league, top_half_totals, w)
-
-        for t in teams:
-            wins = top_half_totals[t.team_name] + t.wins
-            standings.append((wins, t.losses, t.team_name))
+            top_half_wins(league, top_half_totals, w)
 
-        standings = sorted(standings, key=lambda tup: tup[0], reverse=True)
-        standings_txt = [f"{pos + 1:2}: {team_name} ({wins}-{losses}) (+{top_half_totals[team_name]})" for
-                         pos, (wins, losses, team_name) in enumerate(standings)]
+        standings = sorted(((top_half_totals[t] + t.wins, t.losses, t) for t in teams),
+                           key=itemgetter(0), reverse=True)
+        standings_txt = [f"{pos + 1:2}: {team.team_name} ({wins}-{losses}) (+{top_half_totals[team]})" for
+                         pos, (wins, losses, team) in enumerate(standings)]
     if (week <= 13):
        text = ["💯 Current Standings (Playoff %) 💯"] + standings_txt
     if (week >= 14 and week <= 15):
@@ -115,16 +236,14 @@ def get_standings(league, top_half_scoring=False, week=None):
 
 
 def top_half_wins(league, top_half_totals, week):
-    box_scores = league.box_scores(week=week)
+    box_scores = _cached_box_scores(league, week)
 
-    scores = [(i.home_score, i.home_team.team_name) for i in box_scores] + \
-        [(i.away_score, i.away_team.team_name) for i in box_scores if i.away_team]
+    scores = [(i.home_score, i.home_team) for i in box_scores] + \
+        [(i.away_score, i.away_team) for i in box_scores if i.away_team]
 
-    scores = sorted(scores, key=lambda tup: tup[0], reverse=True)
-
-    for i in range(0, len(scores) // 2):
-        points, team_name = scores[i]
-        top_half_totals[team_name] += 1
+    # only the top half is needed, so avoid sorting the whole list
+    for points, team in heapq.nlargest(len(scores) // 2, scores, key=itemgetter(0)):
+        top_half_totals[team] += 1
 
     return top_half_totals
 
@@ -147,12 +266,14 @@ def get_projected_total(lineup):
     total_projected = 0
     for i in lineup:
         # exclude player on bench and injured reserve
-        if i.slot_position != 'BE' and i.slot_position != 'IR':
-            # Check if the player has already played or not
-            if i.points != 0 or i.game_played > 0:
-                total_projected += i.points
-            else:
-                total_projected += i.projected_points
+        if i.slot_position in _BENCH_SLOTS:
+            continue
+        points = i.points
+        # Check if the player has already played or not
+        if points != 0 or i.game_played > 0:
+            total_projected += points
+        else:
+            total_projected += i.projected_points
     return total_projected
 
 
@@ -171,11 +292,42 @@ def all_played(lineup):
         True if all the players in the lineup have played their game, False otherwise.
     """
 
+    # exclude player on bench and injured reserve
+    return all(i.game_played >= 100 for i in lineup if i.slot_position not in _BENCH_SLOTS)
+
+
+def _lineup_stats(lineup):
+    """
+    Retrieve the projected total points and whether all players have played for a given lineup in a single pass.
+
+    Parameters
+    ----------
+    lineup : list
+        A list of player objects that represents the lineup
+
+    Returns
+    -------
+    tuple
+        The projected total points for the given lineup, and True if all the players in the lineup have played
+        their game, False otherwise.
+    """
+
+    total_projected = 0
+    done = True
     for i in lineup:
         # exclude player on bench and injured reserve
-        if i.slot_position != 'BE' and i.slot_position != 'IR' and i.game_played < 100:
-            return False
-    return True
+        if i.slot_position in _BENCH_SLOTS:
+            continue
+        points = i.points
+        game_played = i.game_played
+        # Check if the player has already played or not
+        if points != 0 or game_played > 0:
+            total_projected += points
+        else:
+            total_projected += i.projected_points
+        if game_played < 100:
+            done = False
+    return total_projected, done
 
 
 def get_monitor(league):
@@ -193,7 +345,7 @@ def get_monitor(league):
         A string containing the list of players to monitor, formatted as a list of player names and status.
     """
 
-    box_scores = league.box_scores()
+    box_scores = _cached_box_scores(league)
     monitor = []
     text = ''
     for i in box_scores:
@@ -224,26 +376,20 @@ def scan_roster(lineup, team):
         A list of strings containing the list of players to monitor, formatted as a list of player names and statuses.
     """
 
-    count = 0
     players = []
     for i in lineup:
         # exclude bench and injured players and active or normal players
-        if i.slot_position != 'BE' and i.slot_position != 'IR' and \
+        if i.slot_position not in _BENCH_SLOTS and \
             i.injuryStatus != 'ACTIVE' and i.injuryStatus != 'NORMAL' \
                 and i.game_played == 0:
 
-            count += 1
             player = i.position + ' ' + i.name + ' - ' + i.injuryStatus.title().replace('_', ' ')
             players += [player]
 
-    list = ""
     report = ""
 
-    for p in players:
-        list += p + "\n"
-
-    if count > 0:
-        s = '%s: \n%s \n' % (team.team_name, list[:-1])
+    if players:
+        s = '%s: \n%s \n' % (team.team_name, '\n'.join(players))
         report = [s.lstrip()]
 
     return report
@@ -267,13 +413,16 @@ def get_matchups(league, week=None):
     """
 
     # Gets current week's Matchups
-    matchups = league.box_scores(week=week)
-
-    full_names = ['%s vs %s' % (i.home_team.team_name, i.away_team.team_name) for i in matchups if i.away_team]
+    matchups = _cached_box_scores(league, week, head_to_head=True)
 
-    abbrevs = ['%4s (%s-%s) vs (%s-%s) %s' % (i.home_team.team_abbrev, i.home_team.wins, i.home_team.losses,
-                                              i.away_team.wins, i.away_team.losses, i.away_team.team_abbrev) for i in matchups
-               if i.away_team]
+    full_names = []
+    abbrevs = []
+    for i in matchups:
+        home_team = i.home_team
+        away_team = i.away_team
+        full_names.append('%s vs %s' % (home_team.team_name, away_team.team_name))
+        abbrevs.append('%4s (%s-%s) vs (%s-%s) %s' % (home_team.team_abbrev, home_team.wins, home_team.losses,
+                                                      away_team.wins, away_team.losses, away_team.team_abbrev))
 
     text = ['Matchups'] + full_names + [''] + abbrevs
     return '\n'.join(text)
@@ -297,18 +446,17 @@ def get_close_scores(league, week=None):
     """
 
     # Gets current projected closest scores (10.999 points or closer)
-    box_scores = league.box_scores(week=week)
+    box_scores = _cached_box_scores(league, week, head_to_head=True)
     score = []
 
     for i in box_scores:
-        if i.away_team:
-            away_projected = get_projected_total(i.away_lineup)
-            home_projected = get_projected_total(i.home_lineup)
-            diffScore = away_projected - home_projected
+        away_projected, away_played = _lineup_stats(i.away_lineup)
+        home_projected, home_played = _lineup_stats(i.home_lineup)
+        diffScore = away_projected - home_projected
 
-            if (-11 < diffScore <= 0 and not all_played(i.away_lineup)) or (0 <= diffScore < 11 and not all_played(i.home_lineup)):
-                score += ['%4s %6.2f - %6.2f %s' % (i.home_team.team_abbrev, i.home_projected,
-                                                    i.away_projected, i.away_team.team_abbrev)]
+        if (-11 < diffScore <= 0 and not away_played) or (0 <= diffScore < 11 and not home_played):
+            score += [_SCORE_FMT % (i.home_team.team_abbrev, i.home_projected,
+                                    i.away_projected, i.away_team.team_abbrev)]
 
     if not score:
         return ('')
@@ -339,52 +487,56 @@ def get_waiver_report(league, faab=False):
     activities = league.recent_activity(50)
     # Initialize an empty list to store the report
     report = []
-    # Get the current date
-    today = date.today().strftime('%Y-%m-%d')
+    # Get the current date and its bounds in milliseconds, as used by the activity timestamps
+    today_date = date.today()
+    today = today_date.strftime('%Y-%m-%d')
+    today_start = int(datetime.combine(today_date, datetime.min.time()).timestamp() * 1000)
+    today_end = int(datetime.combine(today_date + timedelta(days=1), datetime.min.time()).timestamp() * 1000)
     text = ''
 
-    # Iterate through each activity
+    # Iterate through each activity, most recent first
     for activity in activities:
+        # Skip activity from after today and stop at the first activity from before today
+        if activity.date >= today_end:
+            continue
+        if activity.date < today_start:
+            break
         actions = activity.actions
-        # Get the date of the activity
-        d2 = date.fromtimestamp(activity.date / 1000).strftime('%Y-%m-%d')
-        # Check if the activity is from today
-        if d2 == today:
-            # Check if the activity is a waiver add (not a drop)
-            if len(actions) == 1 and actions[0][1] == 'WAIVER ADDED':
-                # Get the team, player name and position
-                team_name = actions[0][0].team_name
-                player_name = actions[0][2].name
-                player_position = actions[0][2].position
-                if faab:
-                    # Get the FAAB amount spent
-                    faab_amount = actions[0][3]
-                    # Add the transaction to the report
-                    s = f'{team_name} \nADDED {player_position} {player_name} (${faab_amount})\n'
+        # Check if the activity is a waiver add (not a drop)
+        if len(actions) == 1 and actions[0][1] == 'WAIVER ADDED':
+            # Get the team, player name and position
+            team_name = actions[0][0].team_name
+            player_name = actions[0][2].name
+            player_position = actions[0][2].position
+            if faab:
+                # Get the FAAB amount spent
+                faab_amount = actions[0][3]
+                # Add the transaction to the report
+                s = f'{team_name} \nADDED {player_position} {player_name} (${faab_amount})\n'
+            else:
+                s = f'{team_name} \nADDED {player_position} {player_name}\n'
+            report += [s.lstrip()]
+        elif len(actions) > 1:
+            if actions[0][1] == 'WAIVER ADDED' or actions[1][1] == 'WAIVER ADDED':
+                if actions[0][1] == 'WAIVER ADDED':
+                    if faab:
+                        s = '%s \nADDED %s %s ($%s)\nDROPPED %s %s\n' % (
+                            actions[0][0].team_name, actions[0][2].position, actions[0][2].name,
+                            actions[0][3], actions[1][2].position, actions[1][2].name)
+                    else:
+                        s = '%s \nADDED %s %s\nDROPPED %s %s\n' % (
+                            actions[0][0].team_name, actions[0][2].position, actions[0][2].name,
+                            actions[1][2].position, actions[1][2].name)
                 else:
-                    s = f'{team_name} \nADDED {player_position} {player_name}\n'
-                report += [s.lstrip()]
-            elif len(actions) > 1:
-                if actions[0][1] == 'WAIVER ADDED' or actions[1][1] == 'WAIVER ADDED':
-                    if actions[0][1] == 'WAIVER ADDED':
-                        if faab:
-                            s = '%s \nADDED %s %s ($%s)\nDROPPED %s %s\n' % (
-                                actions[0][0].team_name, actions[0][2].position, actions[0][2].name,
-                                actions[0][3], actions[1][2].position, actions[1][2].name)
-                        else:
-                            s = '%s \nADDED %s %s\nDROPPED %s %s\n' % (
-                                actions[0][0].team_name, actions[0][2].position, actions[0][2].name,
-                                actions[1][2].position, actions[1][2].name)
+                    if faab:
+                        s = '%s \nADDED %s %s ($%s)\nDROPPED %s %s\n' % (
+                            actions[0][0].team_name, actions[1][2].position, actions[1][2].name,
+                            actions[1][3], actions[0][2].position, actions[0][2].name)
                     else:
-                        if faab:
-                            s = '%s \nADDED %s %s ($%s)\nDROPPED %s %s\n' % (
-                                actions[0][0].team_name, actions[1][2].position, actions[1][2].name,
-                                actions[1][3], actions[0][2].position, actions[0][2].name)
-                        else:
-                            s = '%s \nADDED %s %s\nDROPPED %s %s\n' % (
-                                actions[0][0].team_name, actions[1][2].position, actions[1][2].name,
-                                actions[0][2].position, actions[0][2].name)
-                    report += [s.lstrip()]
+                        s = '%s \nADDED %s %s\nDROPPED %s %s\n' % (
+                            actions[0][0].team_name, actions[1][2].position, actions[1][2].name,
+                            actions[0][2].position, actions[0][2].name)
+                report += [s.lstrip()]
 
     report.reverse()
 
@@ -432,7 +584,8 @@ def get_power_rankings(league, week=None):
 
 def get_starter_counts(league):
     """
-    Get the number of starters for each position
+    Get the number of starters for each position. Starting lineup slots do not change during a season,
+    so the counts are remembered per league and season.
 
     Parameters
     ----------
@@ -445,45 +598,31 @@ def get_starter_counts(league):
         A dictionary containing the number of players at each position within the starting lineup.
     """
 
+    key = (league.league_id, league.year)
+    if key in _starter_counts_cache:
+        return _starter_counts_cache[key]
+
     # Get the current week -1 to get the last week's box scores
     week = league.current_week - 1
     # Get the box scores for the specified week
-    box_scores = league.box_scores(week=week)
-    # Initialize a dictionary to store the home team's starters and their positions
-    h_starters = {}
-    # Initialize a variable to keep track of the number of home team starters
-    h_starter_count = 0
-    # Initialize a dictionary to store the away team's starters and their positions
-    a_starters = {}
-    # Initialize a variable to keep track of the number of away team starters
-    a_starter_count = 0
-    # Iterate through each game in the box scores
+    box_scores = _cached_box_scores(league, week)
+    # Keep the lineup with the most starters. In the rare case when someone has an empty slot,
+    # the other lineups still give the full count.
+    starters = Counter()
+    starter_count = 0
     for i in box_scores:
-        # Iterate through each player in the home team's lineup
-        for player in i.home_lineup:
-            # Check if the player is a starter (not on the bench or injured)
-            if (player.slot_position != 'BE' and player.slot_position != 'IR'):
-                # Increment the number of home team starters
-                h_starter_count += 1
-                try:
-                    # Try to increment the count for this position in the h_starters dictionary
-                    h_starters[player.slot_position] = h_starters[player.slot_position] + 1
-                except KeyError:
-                    # If the position is not in the dictionary yet, add it and set the count to 1
-                    h_starters[player.slot_position] = 1
-        # in the rare case when someone has an empty slot we need to check the other team as well
-        for player in i.away_lineup:
-            if (player.slot_position != 'BE' and player.slot_position != 'IR'):
-                a_starter_count += 1
-                try:
-                    a_starters[player.slot_position] = a_starters[player.slot_position] + 1
-                except KeyError:
-                    a_starters[player.slot_position] = 1
-
-        if a_starter_count > h_starter_count:
-            return a_starters
-        else:
-            return h_starters
+        for lineup in (i.home_lineup, i.away_lineup):
+            # Count the starters (not on the bench or injured) at each position
+            lineup_starters = Counter(player.slot_position for player in lineup
+                                      if player.slot_position not in _BENCH_SLOTS)
+            lineup_count = sum(lineup_starters.values())
+            if lineup_count > starter_count:
+                starters = lineup_starters
+                starter_count = lineup_count
+
+    if starters:
+        _starter_counts_cache[key] = starters
+    return starters
 
 
 def best_flex(flexes, player_pool, num):
@@ -508,24 +647,48 @@ def best_flex(flexes, player_pool, num):
         the updated player pool after removing the best flex players
     """
 
-    pool = {}
+    pool = []
     # iterate through each flex position
     for flex_position in flexes:
-        # add players from flex position to the pool
-        try:
-            pool = pool | player_pool[flex_position]
-        except KeyError:
-            pass
-    # sort the pool by score in descending order
-    pool = {k: v for k, v in sorted(pool.items(), key=lambda item: item[1], reverse=True)}
-    # get the top num players from the pool
-    best = dict(list(pool.items())[:num])
-    # remove the best flex players from the player pool
-    for pos in player_pool:
-        for p in best:
-            if p in player_pool[pos]:
-                player_pool[pos].pop(p)
-    return best, player_pool
+        # add players from flex position to the pool, remembering the position they came from
+        players = player_pool.get(flex_position)
+        if players:
+            pool.extend((score, name, flex_position) for name, score in players.items())
+    # get the top num players from the pool by score
+    best = heapq.nlargest(num, pool, key=itemgetter(0))
+    # remove the best flex players from the position they were taken from
+    for score, name, position in best:
+        player_pool[position].pop(name, None)
+    return {name: score for score, name, position in best}, player_pool
+
+
+@lru_cache(maxsize=8)
+def _flex_slots(positions):
+    """
+    Get the flex slots of a starting lineup and the positions eligible for each, in the order they should be filled.
+
+    Parameters
+    ----------
+    positions : tuple
+        The starting lineup slot positions, as found in the starter counts
+
+    Returns
+    -------
+    tuple
+        A tuple of (slot position, eligible positions) pairs. Regular flexes come first, followed by the
+        Offensive Player (OP) and Defensive Player (DP) slots.
+    """
+
+    # flex
+    slots = [(position, tuple(position.split('/'))) for position in positions
+             if 'D/ST' not in position and '/' in position]
+    # Offensive Player
+    if 'OP' in positions:
+        slots.append(('OP', ('RB', 'WR', 'TE', 'QB')))
+    # Defensive Player
+    if 'DP' in positions:
+        slots.append(('DP', ('DT', 'DE', 'LB', 'CB', 'S')))
+    return tuple(slots)
 
 
 def optimal_lineup_score(lineup, starter_counts):
@@ -552,46 +715,23 @@ def optimal_lineup_score(lineup, starter_counts):
     # get all players and points
     score = 0
     for player in lineup:
-        try:
-            position_players[player.position][player.name] = player.points
-        except KeyError:
-            position_players[player.position] = {}
-            position_players[player.position][player.name] = player.points
-        if player.slot_position not in ['BE', 'IR']:
+        position_players.setdefault(player.position, {})[player.name] = player.points
+        if player.slot_position not in _BENCH_SLOTS:
             score += player.points
 
-    # sort players by position for points
+    # pick the top players by points at each position, the rest stay in the pool for the flexes
     for position in starter_counts:
-        try:
-            position_players[position] = {k: v for k, v in sorted(
-                position_players[position].items(), key=lambda item: item[1], reverse=True)}
-            best_lineup[position] = dict(list(position_players[position].items())[:starter_counts[position]])
-            position_players[position] = dict(list(position_players[position].items())[starter_counts[position]:])
-        except KeyError:
+        players = position_players.get(position)
+        if players is None:
             best_lineup[position] = {}
+            continue
+        best_lineup[position] = dict(heapq.nlargest(starter_counts[position], players.items(), key=itemgetter(1)))
+        for name in best_lineup[position]:
+            del players[name]
 
-    # flexes. need to figure out best in other single positions first
-    for position in starter_counts:
-        # flex
-        if 'D/ST' not in position and '/' in position:
-            flex = position.split('/')
-            result = best_flex(flex, position_players, starter_counts[position])
-            best_lineup[position] = result[0]
-            position_players = result[1]
-
-    # Offensive Player. need to figure out best in other positions first
-    if 'OP' in starter_counts:
-        flex = ['RB', 'WR', 'TE', 'QB']
-        result = best_flex(flex, position_players, starter_counts['OP'])
-        best_lineup['OP'] = result[0]
-        position_players = result[1]
-
-    # Defensive Player. need to figure out best in other positions first
-    if 'DP' in starter_counts:
-        flex = ['DT', 'DE', 'LB', 'CB', 'S']
-        result = best_flex(flex, position_players, starter_counts['DP'])
-        best_lineup['DP'] = result[0]
-        position_players = result[1]
+    # flexes, OP and DP. need to figure out best in other single positions first
+    for position, flex in _flex_slots(tuple(starter_counts)):
+        best_lineup[position], position_players = best_flex(flex, position_players, starter_counts[position])
 
     best_score = 0
     for position in best_lineup:
@@ -624,7 +764,7 @@ def optimal_team_scores(league, week=None, full_report=False):
 
     if not week:
         week = league.current_week - 1
-    box_scores = league.box_scores(week=week)
+    box_scores = _cached_box_scores(league, week)
     results = []
     best_scores = {}
     starter_counts = get_starter_counts(league)
@@ -635,43 +775,32 @@ def optimal_team_scores(league, week=None, full_report=False):
         if i.away_team != 0:
             best_scores[i.away_team] = optimal_lineup_score(i.away_lineup, starter_counts)
 
-    best_scores = {key: value for key, value in sorted(best_scores.items(), key=lambda item: item[1][3], reverse=True)}
-
     if full_report:
-        i = 1
-        for score in best_scores:
-            s = ['%2d: %4s: %6.2f (%6.2f - %.2f%%)' %
-                 (i, score.team_abbrev, best_scores[score][0],
-                  best_scores[score][1], best_scores[score][3])]
-            results += s
-            i += 1
+        ranked = sorted(best_scores.items(), key=lambda item: item[1][3], reverse=True)
+        for i, (team, (best_score, score, _, score_pct)) in enumerate(ranked, 1):
+            results.append('%2d: %4s: %6.2f (%6.2f - %.2f%%)' % (i, team.team_abbrev, best_score, score, score_pct))
 
         text = ['Optimal Scores:  (Actual - % of optimal)'] + results
         return '\n'.join(text)
     else:
-        num_teams = 0
-        team_names = ''
-        for score in best_scores:
-            if best_scores[score][3] > 99.8:
-                num_teams += 1
-                team_names += score.team_name + ', '
-            else:
-                break
+        # only the extremes are needed, no need to sort every team
+        perfect = sorted(((team, value) for team, value in best_scores.items() if value[3] > 99.8),
+                         key=lambda item: item[1][3], reverse=True)
 
-        if num_teams <= 1:
-            best = next(iter(best_scores.items()))
+        if len(perfect) <= 1:
+            best = max(best_scores.items(), key=lambda item: item[1][3])
             best_mgr_str = ['🤖 Best Manager: %s scored %.2f%% of their optimal score!' % (best[0].team_name, best[1][3])]
         else:
-            team_names = team_names[:-2]
-            best_mgr_str = ['🤖 Best Managers: f{team_names} scored their optimal score!']
+            team_names = ', '.join(team.team_name for team, _ in perfect)
+            best_mgr_str = [f'🤖 Best Managers: {team_names} scored their optimal score!']
 
-        worst = best_scores.popitem()
+        worst = min(best_scores.items(), key=lambda item: item[1][3])
         worst_mgr_str = ['🤡 Worst Manager: %s left %.2f points on their bench, only scoring %.2f%% of their optimal score.' %
                                                  (worst[0].team_name, worst[1][0] - worst[1][1], worst[1][3])]
         return (best_mgr_str + worst_mgr_str)
 
 
-def get_achievers_trophy(league, week=None):
+def get_achievers_trophy(league, week=None, box_scores=None):
     """
     This function returns the overachiever and underachiever of the league
     based on the difference between the projected score and the actual score.
@@ -682,6 +811,8 @@ def get_achievers_trophy(league, week=None):
         The league object for which the overachiever and underachiever are being determined
     week : int, optional
         The week for which the overachiever and underachiever are to be returned (default is current week)
+    box_scores : list, optional
+        The box scores for the week, if the caller already has them (default is to retrieve them)
 
     Returns
     -------
@@ -689,29 +820,17 @@ def get_achievers_trophy(league, week=None):
         A string representing the overachiever and underachiever of the league
     """
 
-    box_scores = league.box_scores(week=week)
-    over_achiever = ''
-    under_achiever = ''
-    best_performance = -9999
-    worst_performance = 9999
+    if box_scores is None:
+        box_scores = _cached_box_scores(league, week)
+    performances = []
     for i in box_scores:
-        home_performance = i.home_score - i.home_projected
-        away_performance = i.away_score - i.away_projected
-
         if i.home_team != 0:
-            if home_performance > best_performance:
-                best_performance = home_performance
-                over_achiever = i.home_team.team_name
-            if home_performance < worst_performance:
-                worst_performance = home_performance
-                under_achiever = i.home_team.team_name
+            performances.append((i.home_score - i.home_projected, i.home_team.team_name))
         if i.away_team != 0:
-            if away_performance > best_performance:
-                best_performance = away_performance
-                over_achiever = i.away_team.team_name
-            if away_performance < worst_performance:
-                worst_performance = away_performance
-                under_achiever = i.away_team.team_name
+            performances.append((i.away_score - i.away_projected, i.away_team.team_name))
+
+    best_performance, over_achiever = max(performances, key=itemgetter(0), default=(-9999, ''))
+    worst_performance, under_achiever = min(performances, key=itemgetter(0), default=(9999, ''))
 
     if best_performance > 0:
         high_achiever_str = ['📈 Overachiever: %s was %.2f points over their projection' % (over_achiever, best_performance)]
@@ -726,32 +845,36 @@ def get_achievers_trophy(league, week=None):
     return (high_achiever_str + low_achiever_str)
 
 
-def get_lucky_trophy(league, week=None):
+def get_lucky_trophy(league, week=None, box_scores=None):
     """
     This function takes in a league object and an optional week parameter. It retrieves the box scores for the specified league and week, and creates a dictionary with the weekly scores for each team. The teams are sorted in descending order by their scores, and the team with the highest score is determined to be the lucky team for the week. The team with the lowest score is determined to be the unlucky team for the week. The function returns a list containing the lucky and unlucky teams, along with their records for the week.
 
     Parameters:
     league (object): A league object containing information about the league and its teams.
     week (int, optional): The week for which the box scores should be retrieved. If no week is specified, the current week will be used.
+    box_scores (list, optional): The box scores for the week, if the caller already has them. If not given, they will be retrieved.
 
     Returns:
     list: A list containing the lucky and unlucky teams, along with their records for the week.
     """
-    box_scores = league.box_scores(week=week)
+    if box_scores is None:
+        matchups = _cached_box_scores(league, week, head_to_head=True)
+    else:
+        matchups = [i for i in box_scores if i.home_team and i.away_team]
     weekly_scores = {}
-    for i in box_scores:
-        if i.home_team != 0 and i.away_team != 0:
-            if i.home_score > i.away_score:
-                weekly_scores[i.home_team] = [i.home_score, 'W']
-                weekly_scores[i.away_team] = [i.away_score, 'L']
-            else:
-                weekly_scores[i.home_team] = [i.home_score, 'L']
-                weekly_scores[i.away_team] = [i.away_score, 'W']
-    weekly_scores = dict(sorted(weekly_scores.items(), key=lambda item: item[1], reverse=True))
+    for i in matchups:
+        if i.home_score > i.away_score:
+            weekly_scores[i.home_team] = [i.home_score, 'W']
+            weekly_scores[i.away_team] = [i.away_score, 'L']
+        else:
+            weekly_scores[i.home_team] = [i.home_score, 'L']
+            weekly_scores[i.away_team] = [i.away_score, 'W']
+    # sort once by score, highest first. the unlucky team is scanned for from the top and the lucky team from the bottom
+    sorted_scores = sorted(weekly_scores.items(), key=lambda item: item[1][0], reverse=True)
 
     # losses = 0
-    # for t in weekly_scores:
-    #     print(t.team_name + ': (' + str(len(weekly_scores)-1-losses) + '-' + str(losses) +')')
+    # for t, _ in sorted_scores:
+    #     print(t.team_name + ': (' + str(len(sorted_scores)-1-losses) + '-' + str(losses) +')')
     #     losses+=1
 
     losses = 0
@@ -759,19 +882,18 @@ def get_lucky_trophy(league, week=None):
     unlucky_record = ''
     lucky_team_name = ''
     lucky_record = ''
-    num_teams = len(weekly_scores) - 1
+    num_teams = len(sorted_scores) - 1
 
-    for t in weekly_scores:
-        if weekly_scores[t][1] == 'L':
+    for t, (score, result) in sorted_scores:
+        if result == 'L':
             unlucky_team_name = t.team_name
             unlucky_record = str(num_teams - losses) + '-' + str(losses)
             break
         losses += 1
 
     wins = 0
-    weekly_scores = dict(sorted(weekly_scores.items(), key=lambda item: item[1]))
-    for t in weekly_scores:
-        if weekly_scores[t][1] == 'W':
+    for t, (score, result) in reversed(sorted_scores):
+        if result == 'W':
             lucky_team_name = t.team_name
             lucky_record = str(wins) + '-' + str(num_teams - wins)
             break
@@ -781,6 +903,27 @@ def get_lucky_trophy(league, week=None):
     unlucky_str = ['😡 Unlucky: %s was %s against the league, but still took an L' % (unlucky_team_name, unlucky_record)]
     return (lucky_str + unlucky_str)
 
+def _performance(points, projected):
+    """
+    Get how a player performed against their projection, used to rank players for the MVP and LVP trophies.
+
+    Parameters
+    ----------
+    points : float
+        The points the player scored
+    projected : float
+        The points the player was projected to score, must be greater than 0
+
+    Returns
+    -------
+    tuple
+        The difference between points and projection relative to the projection, and the plain difference.
+    """
+
+    proj_diff = points - projected
+    return (proj_diff / projected, proj_diff)
+
+
 def get_mvp_lvp(league, week=None):
     """
     Returns trophies for Most Valuable Player, Most Valuable Defense, Least Valuable Player and Least Valuable Defense.
@@ -800,104 +943,30 @@ def get_mvp_lvp(league, week=None):
     """
  
     # Gets trophies for week MVP, MVD, LVP & LVD
-    matchups = league.box_scores(week=week)
-
-    mvp_score_diff = -100
-    mvp_proj = -100
-    mvp_score = ''
-    mvp = ''
-    mvp_team = -1
-
-    mvd_score_diff = -100
-    mvd_proj = -100
-    mvd_score = ''
-    mvd = ''
-    mvd_team = -1
-
-    lvp_score_diff = 999
-    lvp_proj = 999
-    lvp_score = ''
-    lvp = ''
-    lvp_team = -1
-
-    lvd_score_diff = 999
-    lvd_proj = 999
-    lvd_score = ''
-    lvd = ''
-    lvd_team = -1
+    # every starter with a projection as (performance, player, team), defenses are kept separate
+    players = []
+    defenses = []
+    for starter in _cached_starters(league, week):
+        if starter[1].slot_position == 'D/ST':
+            defenses.append(starter)
+        else:
+            players.append(starter)
+
+    # ties on the relative difference are broken by the points difference, then by the first player found
+    _, mvp, mvp_team = max(players, key=itemgetter(0))
+    _, lvp, lvp_team = min(players, key=itemgetter(0))
+    _, mvd, mvd_team = max(defenses, key=itemgetter(0))
+    _, lvd, lvd_team = min(defenses, key=itemgetter(0))
+
+    mvp_str = ['💯 MVP: %s %s, %s with %.2f points (%.2f proj)' % (
+        mvp.position, mvp.name, mvp_team.team_abbrev, mvp.points, mvp.projected_points)]
+    mvd_str = ['✅ MVD: %s, %s with %.0f points (%.2f proj)' % (
+        mvd.name, mvd_team.team_abbrev, mvd.points, mvd.projected_points)]
+    lvp_str = ['💀 LVP: %s %s, %s with %.2f points (%.2f proj)' % (
+        lvp.position, lvp.name, lvp_team.team_abbrev, lvp.points, lvp.projected_points)]
+    lvd_str = ['🔴 LVD: %s, %s with %.0f points (%.2f proj)' % (
+        lvd.name, lvd_team.team_abbrev, lvd.points, lvd.projected_points)]
 
-    for i in matchups:
-        for p in i.home_lineup:
-            if p.slot_position != 'BE' and p.slot_position != 'D/ST' and p.slot_position != 'IR' and p.projected_points > 0:
-                score_diff = (p.points - p.projected_points)/p.projected_points
-                proj_diff = p.points - p.projected_points
-                if (score_diff > mvp_score_diff) or (score_diff == mvp_score_diff and proj_diff > mvp_proj):
-                    mvp_score_diff = score_diff
-                    mvp_proj = proj_diff
-                    mvp_score = '%.2f points (%.2f proj)' % (p.points, p.projected_points)
-                    mvp = p.position + ' ' + p.name
-                    mvp_team = i.home_team
-                elif (score_diff < lvp_score_diff) or (score_diff == lvp_score_diff and proj_diff < lvp_proj):
-                    lvp_score_diff = score_diff
-                    lvp_proj = proj_diff
-                    lvp_score = '%.2f points (%.2f proj)' % (p.points, p.projected_points)
-                    lvp = p.position + ' ' + p.name
-                    lvp_team = i.home_team
-        for p in i.away_lineup:
-            if p.slot_position != 'BE' and p.slot_position != 'D/ST' and p.slot_position != 'IR' and p.projected_points > 0:
-                score_diff = (p.points - p.projected_points)/p.projected_points
-                proj_diff = p.points - p.projected_points
-                if (score_diff > mvp_score_diff) or (score_diff == mvp_score_diff and proj_diff > mvp_proj):
-                    mvp_score_diff = score_diff
-                    mvp_proj = proj_diff
-                    mvp_score = '%.2f points (%.2f proj)' % (p.points, p.projected_points)
-                    mvp = p.position + ' ' + p.name
-                    mvp_team = i.away_team
-                elif (score_diff < lvp_score_diff) or (score_diff == lvp_score_diff and proj_diff < lvp_proj):
-                    lvp_score_diff = score_diff
-                    lvp_proj = proj_diff
-                    lvp_score = '%.2f points (%.2f proj)' % (p.points, p.projected_points)
-                    lvp = p.position + ' ' + p.name
-                    lvp_team = i.away_team
-
-        for p in i.home_lineup:
-            if p.slot_position == 'D/ST' and p.projected_points > 0:
-                score_diff = (p.points - p.projected_points)/p.projected_points
-                proj_diff = p.points - p.projected_points
-                if (score_diff > mvd_score_diff) or (score_diff == mvd_score_diff and proj_diff > mvd_proj):
-                    mvd_score_diff = score_diff
-                    mvd_proj = proj_diff
-                    mvd_score = '%.0f points (%.2f proj)' % (p.points, p.projected_points)
-                    mvd = p.name
-                    mvd_team = i.home_team
-                elif (score_diff < lvd_score_diff) or (score_diff == lvd_score_diff and proj_diff < lvd_proj):
-                    lvd_score_diff = score_diff
-                    lvd_proj = proj_diff
-                    lvd_score = '%.0f points (%.2f proj)' % (p.points, p.projected_points)
-                    lvd = p.name
-                    lvd_team = i.home_team
-        for p in i.away_lineup:
-            if p.slot_position == 'D/ST' and p.projected_points > 0:
-                score_diff = (p.points - p.projected_points)/p.projected_points
-                proj_diff = p.points - p.projected_points
-                if (score_diff > mvd_score_diff) or (score_diff == mvd_score_diff and proj_diff > mvd_proj):
-                    mvd_score_diff = score_diff
-                    mvd_proj = proj_diff
-                    mvd_score = '%.0f points (%.2f proj)' % (p.points, p.projected_points)
-                    mvd = p.name
-                    mvd_team = i.away_team
-                elif (score_diff < lvd_score_diff) or (score_diff == lvd_score_diff and proj_diff < lvd_proj):
-                    lvd_score_diff = score_diff
-                    lvd_proj = proj_diff
-                    lvd_score = '%.0f points (%.2f proj)' % (p.points, p.projected_points)
-                    lvd = p.name
-                    lvd_team = i.away_team
-
-    mvp_str = ['💯 MVP: %s, %s with %s' % (mvp, mvp_team.team_abbrev, mvp_score)]
-    mvd_str = ['✅ MVD: %s, %s with %s' % (mvd, mvd_team.team_abbrev, mvd_score)]
-    lvp_str = ['💀 LVP: %s, %s with %s' % (lvp, lvp_team.team_abbrev, lvp_score)]
-    lvd_str = ['🔴 LVD: %s, %s with %s' % (lvd, lvd_team.team_abbrev, lvd_score)]
-   
     return (mvp_str + lvp_str + mvd_str + lvd_str)
 
 
@@ -919,62 +988,69 @@ def get_trophies(league, week=None):
     """
 
     # Gets trophies for highest score, lowest score, closest score, and biggest win
-    matchups = league.box_scores(week=week)
-    low_score = 9999
-    low_team_name = ''
-    high_score = -1
-    high_team_name = ''
-    closest_score = 9999
-    close_winner = ''
-    close_loser = ''
-    biggest_blowout = -1
-    blown_out_team_name = ''
-    ownerer_team_name = ''
+    matchups = _cached_box_scores(league, week)
+    # (points, team name) for every team, and (margin, winner name, loser name) for every head to head matchup
+    scores = []
+    margins = []
 
     for i in matchups:
-        if i.home_team != 0:
-            if i.home_score > high_score:
-                high_score = i.home_score
-                high_team_name = i.home_team.team_name
-            if i.home_score < low_score:
-                low_score = i.home_score
-                low_team_name = i.home_team.team_name
-        if i.away_team != 0:
-            if i.away_score > high_score:
-                high_score = i.away_score
-                high_team_name = i.away_team.team_name
-            if i.away_score < low_score:
-                low_score = i.away_score
-                low_team_name = i.away_team.team_name
-
-        if i.away_team != 0 and i.home_team != 0:
-            if i.away_score - i.home_score != 0 and \
-                    abs(i.away_score - i.home_score) < closest_score:
-                closest_score = abs(i.away_score - i.home_score)
-                if i.away_score - i.home_score < 0:
-                    close_winner = i.home_team.team_name
-                    close_loser = i.away_team.team_name
-                else:
-                    close_winner = i.away_team.team_name
-                    close_loser = i.home_team.team_name
-            if abs(i.away_score - i.home_score) > biggest_blowout:
-                biggest_blowout = abs(i.away_score - i.home_score)
-                if i.away_score - i.home_score < 0:
-                    ownerer_team_name = i.home_team.team_name
-                    blown_out_team_name = i.away_team.team_name
-                else:
-                    ownerer_team_name = i.away_team.team_name
-                    blown_out_team_name = i.home_team.team_name
+        home_team, away_team = i.home_team, i.away_team
+        home_score, away_score = i.home_score, i.away_score
+        if home_team:
+            scores.append((home_score, home_team.team_name))
+        if away_team:
+            scores.append((away_score, away_team.team_name))
+
+        if home_team and away_team:
+            diff = away_score - home_score
+            if diff < 0:
+                margins.append((abs(diff), home_team.team_name, away_team.team_name))
+            else:
+                margins.append((abs(diff), away_team.team_name, home_team.team_name))
+
+    high_score, high_team_name = max(scores, key=itemgetter(0), default=(-1, ''))
+    low_score, low_team_name = min(scores, key=itemgetter(0), default=(9999, ''))
+    # a tie is not a close win
+    closest_score, close_winner, close_loser = min((m for m in margins if m[0] != 0), key=itemgetter(0),
+                                                   default=(9999, '', ''))
+    biggest_blowout, ownerer_team_name, blown_out_team_name = max(margins, key=itemgetter(0), default=(-1, '', ''))
+
+    text = ['🏆 Trophies of the week: 🏆']
+    text.append(f'👑 Highest score: {high_team_name} with {high_score:.2f} points')
+    text.append(f'💩 Lowest score: {low_team_name} with {low_score:.2f} points')
+    text.append(f'😱 Blow out: {ownerer_team_name} blew out {blown_out_team_name} by {biggest_blowout:.2f} points')
+    text.append(f'😅 Close win: {close_winner} barely beat {close_loser} by {closest_score:.2f} points')
+    text.extend(get_lucky_trophy(league, week, box_scores=matchups))
+    text.extend(get_achievers_trophy(league, week, box_scores=matchups))
+    text.extend(get_mvp_lvp(league, week))
+    text.extend(optimal_team_scores(league, week))
+    return '\n'.join(text)
 
-    high_score_str = ['👑 Highest score: %s with %.2f points' % (high_team_name, high_score)]
-    low_score_str = ['💩 Lowest score: %s with %.2f points' % (low_team_name, low_score)]
-    close_score_str = ['😅 Close win: %s barely beat %s by %.2f points' % (close_winner, close_loser, closest_score)]
-    blowout_str = ['😱 Blow out: %s blew out %s by %.2f points' % (ownerer_team_name, blown_out_team_name, biggest_blowout)]
+def _best_worst_performances(league, week):
+    """
+    Get the best and worst single week performance against projection for a given week, used by the season trophies.
+    D/ST is not included, players with a tiny projection can not be the best and kickers can not be the worst.
+
+    Parameters
+    ----------
+    league : object
+        The league object for which the performances are to be returned
+    week : int
+        The week for which the performances are to be returned
+
+    Returns
+    -------
+    tuple
+        The best and the worst performance, each as a (performance, player, team) tuple or None if there is none.
+    """
+
+    starters = _cached_starters(league, week)
+    best_pool = [s for s in starters if s[1].position != 'D/ST' and s[1].projected_points > 0.1]
+    worst_pool = [s for s in starters if s[1].position != 'D/ST' and s[1].position != 'K']
+    best = max(best_pool, key=itemgetter(0), default=None)
+    worst = min(worst_pool, key=itemgetter(0), default=None)
+    return best, worst
 
-    text = ['🏆 Trophies of the week: 🏆'] + high_score_str + low_score_str + blowout_str + close_score_str + \
-        get_lucky_trophy(league, week) + get_achievers_trophy(league, week) + get_mvp_lvp(league, week) + \
-        optimal_team_scores(league, week)
-    return '\n'.join(text)
 
 def season_trophies(league):
     """
@@ -991,35 +1067,20 @@ def season_trophies(league):
         A string representing the trophies
     """
 
-    mvp_score_diff = -100
-    mvp_proj = -100
-    mvp_score = ''
-    mvp = ''
-    mvp_team = -1
-    mvp_week = 0
-
     smvp_score_diff = -100
     smvp_proj = -100
-    smvp_score = ''
-    smvp = ''
+    smvp_player = None
     smvp_team = -1
 
-    lvp_score_diff = 999
-    lvp_proj = 999
-    lvp_score = ''
-    lvp = ''
-    lvp_team = -1
-    lvp_week = 0
-
     slvp_score_diff = 999
     slvp_proj = 999
-    slvp_score = ''
-    slvp = ''
+    slvp_player = None
     slvp_team = -1
 
-    most_moves = 0
-    moves_score = ''
-    moves_team = -1
+    moves_team = max(league.teams, key=lambda t: t.acquisitions + t.drops + t.trades)
+    moves_score = '%d total moves (%d adds, %d drops, %d trades)' % (
+        moves_team.acquisitions + moves_team.drops + moves_team.trades,
+        moves_team.acquisitions, moves_team.drops, moves_team.trades)
 
     high_score = 0
     score_team = 0
@@ -1030,95 +1091,59 @@ def season_trophies(league):
     low_week = 0
 
     for team in league.teams:
-        moves = team.acquisitions + team.drops + team.trades
-        if moves > most_moves:
-            most_moves = moves
-            moves_score = '%d total moves (%d adds, %d drops, %d trades)' % (
-                moves, team.acquisitions, team.drops, team.trades)
-            moves_team = team
-
-        for score in team.scores:
+        # the team's best and worst week, team.scores holds one score per week starting at week 1
+        if team.scores:
+            week, score = max(enumerate(team.scores, 1), key=itemgetter(1))
             if score > high_score:
-                high_score = score
-                score_team = team
-                score_week = team.scores.index(score)
+                high_score, score_team, score_week = score, team, week
+            week, score = min(enumerate(team.scores, 1), key=itemgetter(1))
             if score < low_score:
-                low_score = score
-                low_team = team
-                low_week = team.scores.index(score)
-
-        for p in team.roster:
-            if p.projected_total_points > 0:
-                score_diff = (p.total_points - p.projected_total_points)/p.projected_total_points
-                proj_diff = p.total_points - p.projected_total_points
-                if (score_diff > smvp_score_diff) or (score_diff == smvp_score_diff and proj_diff > smvp_proj):
-                    smvp_score_diff = score_diff
-                    smvp_proj = proj_diff
-                    smvp_score = '%.2f points (%.2f proj)' % (p.total_points, p.projected_total_points)
-                    smvp = p.position + ' ' + p.name
-                    smvp_team = team
-                elif (score_diff < slvp_score_diff) or (score_diff == slvp_score_diff and proj_diff < slvp_proj):
-                    slvp_score_diff = score_diff
-                    slvp_proj = proj_diff
-                    slvp_score = '%.2f points (%.2f proj)' % (p.total_points, p.projected_total_points)
-                    slvp = p.position + ' ' + p.name
-                    slvp_team = team
-
-    z = 1
-    while z <= 18:
-        matchups = league.box_scores(week=z)
-        for i in matchups:
-            for p in i.home_lineup:
-                if p.slot_position != 'BE' and p.slot_position != 'IR' and p.position != 'D/ST' and p.projected_points > 0:
-                    score_diff = (p.points - p.projected_points)/p.projected_points
-                    proj_diff = p.points - p.projected_points
-                    if (score_diff > mvp_score_diff) or (score_diff == mvp_score_diff and proj_diff > mvp_proj):
-                        if p.projected_points > 0.1:
-                            mvp_score_diff = score_diff
-                            mvp_proj = proj_diff
-                            mvp_score = '%.2f points (%.2f proj)' % (p.points, p.projected_points)
-                            mvp = p.position + ' ' + p.name
-                            mvp_team = i.home_team
-                            mvp_week = z
-                    elif (score_diff < lvp_score_diff) or (score_diff == lvp_score_diff and proj_diff < lvp_proj):
-                        if p.position != 'K':
-                            lvp_score_diff = score_diff
-                            lvp_proj = proj_diff
-                            lvp_score = '%.2f points (%.2f proj)' % (p.points, p.projected_points)
-                            lvp = p.position + ' ' + p.name
-                            lvp_team = i.home_team
-                            lvp_week = z
-
-            for p in i.away_lineup:
-                if p.slot_position != 'BE' and p.slot_position != 'IR' and p.position != 'D/ST' and p.projected_points > 0:
-                    score_diff = (p.points - p.projected_points)/p.projected_points
-                    proj_diff = p.points - p.projected_points
-                    if (score_diff > mvp_score_diff) or (score_diff == mvp_score_diff and proj_diff > mvp_proj):
-                        if p.projected_points > 0.1:
-                            mvp_score_diff = score_diff
-                            mvp_proj = proj_diff
-                            mvp_score = '%.2f points (%.2f proj)' % (p.points, p.projected_points)
-                            mvp = p.position + ' ' + p.name
-                            mvp_team = i.away_team
-                            mvp_week = z
-                    elif (score_diff < lvp_score_diff) or (score_diff == lvp_score_diff and proj_diff < lvp_proj):
-                        if p.position != 'K':
-                            lvp_score_diff = score_diff
-                            lvp_proj = proj_diff
-                            lvp_score = '%.2f points (%.2f proj)' % (p.points, p.projected_points)
-                            lvp = p.position + ' ' + p.name
-                            lvp_team = i.away_team
-                            lvp_week = z
-        z = z+1
-
-    moves_str = ['🔄 Most Moves: %s with %s' % (moves_team.team_name, moves_score)]
-    high_score_str = ['⭐ Highest Score: %s with %.2f points on Week %d' % (score_team.team_name, high_score, score_week)]
-    low_score_str = ['💩 Lowest Score: %s with %.2f points on Week %d' % (low_team.team_name, low_score, low_week)]
-    mvp_str = ['✅ Best Performance: %s, Week %d, %s with %s' % (mvp, mvp_week, mvp_team.team_abbrev, mvp_score)]
-    lvp_str = ['🔴 Worst Performance: %s, Week %d, %s with %s' % (lvp, lvp_week, lvp_team.team_abbrev, lvp_score)]
-    smvp_str = ['💯 Season MVP: %s, %s with %s' % (smvp, smvp_team.team_abbrev, smvp_score)]
-    slvp_str = ['💀 Season LVP: %s, %s with %s' % (slvp, slvp_team.team_abbrev, slvp_score)]
-
-    text = ['🏆🏆 End of Season Awards 🏆🏆'] + moves_str + high_score_str + low_score_str + mvp_str + lvp_str + smvp_str + slvp_str + [' ']
+                low_score, low_team, low_week = score, team, week
+
+        eligible = [p for p in team.roster if p.projected_total_points > 0]
+        for p in eligible:
+            projected = p.projected_total_points
+            proj_diff = p.total_points - projected
+            score_diff = proj_diff/projected
+            if (score_diff > smvp_score_diff) or (score_diff == smvp_score_diff and proj_diff > smvp_proj):
+                smvp_score_diff = score_diff
+                smvp_proj = proj_diff
+                smvp_player = p
+                smvp_team = team
+            elif (score_diff < slvp_score_diff) or (score_diff == slvp_score_diff and proj_diff < slvp_proj):
+                slvp_score_diff = score_diff
+                slvp_proj = proj_diff
+                slvp_player = p
+                slvp_team = team
+
+    # the weeks are independent, so fetch and scan them concurrently
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        weekly = list(executor.map(lambda week: _best_worst_performances(league, week), range(1, 19)))
+
+    # reduce over the weeks in order, so ties go to the earliest week
+    best = [(b[0], week, b[1], b[2]) for week, (b, w) in enumerate(weekly, 1) if b]
+    worst = [(w[0], week, w[1], w[2]) for week, (b, w) in enumerate(weekly, 1) if w]
+    _, mvp_week, mvp_player, mvp_team = max(best, key=itemgetter(0))
+    _, lvp_week, lvp_player, lvp_team = min(worst, key=itemgetter(0))
+    mvp_score = _POINTS_FMT % (mvp_player.points, mvp_player.projected_points)
+    mvp = mvp_player.position + ' ' + mvp_player.name
+    lvp_score = _POINTS_FMT % (lvp_player.points, lvp_player.projected_points)
+    lvp = lvp_player.position + ' ' + lvp_player.name
+    smvp_score = _POINTS_FMT % (smvp_player.total_points, smvp_player.projected_total_points)
+    smvp = smvp_player.position + ' ' + smvp_player.name
+    slvp_score = _POINTS_FMT % (slvp_player.total_points, slvp_player.projected_total_points)
+    slvp = slvp_player.position + ' ' + slvp_player.name
+
+    text = [
+        '🏆🏆 End of Season Awards 🏆🏆',
+        f'🔄 Most Moves: {moves_team.team_name} with {moves_score}',
+        f'⭐ Highest Score: {score_team.team_name} with {high_score:.2f} points on Week {score_week}',
+        f'💩 Lowest Score: {low_team.team_name} with {low_score:.2f} points on Week {low_week}',
+        f'✅ Best Performance: {mvp}, Week {mvp_week}, {mvp_team.team_abbrev} with {mvp_score}',
+        f'🔴 Worst Performance: {lvp}, Week {lvp_week}, {lvp_team.team_abbrev} with {lvp_score}',
+        f'💯 Season MVP: {smvp}, {smvp_team.team_abbrev} with {smvp_score}',
+        f'💀 Season LVP: {slvp}, {slvp_team.team_abbrev} with {slvp_score}',
+        ' ',
+    ]
 
     return '\n'.join(text)